@@ -9,7 +9,8 @@ import sys
 import os
 import json
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 # Add src to path for imports
@@ -17,6 +18,57 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from pdf_extractor import MultilingualPDFOutlineExtractor
 
+# Optional fast JSON serializer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dump_json(obj, path: str):
+    """Write obj as indented UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Write the prebuilt bytes directly, bypassing the text codec layer
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _extract_and_save(extractor: MultilingualPDFOutlineExtractor, pdf_path: str,
+                      output_file: Optional[str] = None) -> Tuple[Dict, float]:
+    """Run the extractor on one PDF and optionally save the JSON result"""
+    start_time = time.time()
+    result = extractor.process_pdf_multilingual(pdf_path)
+    processing_time = time.time() - start_time
+    
+    if output_file:
+        _dump_json(result, output_file)
+    
+    return result, processing_time
+
+
+def _process_pdf_worker(pdf_path: str, output_file: Optional[str] = None) -> Tuple[Dict, float, Dict]:
+    """
+    Process a single PDF inside a worker process (module-level so it pickles)
+    
+    A fresh extractor per task keeps each result independent of which worker
+    ran it and what that worker processed before.
+    
+    Returns:
+        Tuple[Dict, float, Dict]: Result, processing time and font statistics
+    """
+    extractor = MultilingualPDFOutlineExtractor()
+    result, processing_time = _extract_and_save(extractor, pdf_path, output_file)
+    return result, processing_time, extractor.font_analyzer.get_font_statistics()
+
 
 class PDFExtractorCLI:
     """Command-line interface for the Enhanced PDF Outline Extractor"""
@@ -47,21 +99,19 @@ class PDFExtractorCLI:
         """Process a single PDF file"""
         print(f"Processing: {os.path.basename(pdf_path)}")
         
-        start_time = time.time()
-        result = self.extractor.process_pdf_multilingual(pdf_path)
-        processing_time = time.time() - start_time
+        result, processing_time = _extract_and_save(self.extractor, pdf_path, output_file)
+        self.report_result(result, processing_time, output_file)
         
-        # Save result if output file specified
+        return result
+    
+    def report_result(self, result: Dict, processing_time: float, output_file: Optional[str] = None):
+        """Print the outcome of processing a single PDF"""
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
             print(f"  ✓ Results saved to: {output_file}")
         
         print(f"  ✓ Found {len(result.get('outline', []))} headings")
         print(f"  ✓ Languages: {result.get('metadata', {}).get('detected_languages', [])}")
         print(f"  ✓ Processing time: {processing_time:.2f}s")
-        
-        return result
     
     def process_directory(self, languages: Optional[List[str]] = None) -> Dict:
         """Process all PDF files in the input directory"""
@@ -81,24 +131,48 @@ class PDFExtractorCLI:
         total_headings = 0
         detected_languages = set()
         
-        # Process each PDF
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(self.input_dir, pdf_file)
-            output_file = os.path.join(self.output_dir, pdf_file.replace('.pdf', '_outline.json'))
-            
-            result = self.process_single_pdf(pdf_path, output_file)
+        # Process PDFs in parallel; each document is independent
+        results = {}
+        font_statistics = {}
+        max_workers = min(os.cpu_count() or 1, len(pdf_files))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for pdf_file in pdf_files:
+                pdf_path = os.path.join(self.input_dir, pdf_file)
+                output_file = os.path.join(self.output_dir, pdf_file.replace('.pdf', '_outline.json'))
+                future = executor.submit(_process_pdf_worker, pdf_path, output_file)
+                futures[future] = (pdf_file, pdf_path, output_file)
             
-            # Collect statistics
+            for future in as_completed(futures):
+                pdf_file, pdf_path, output_file = futures[future]
+                result, processing_time, font_statistics[pdf_file] = future.result()
+                
+                print(f"Processed: {pdf_file}")
+                self.report_result(result, processing_time, output_file)
+                results[pdf_file] = result
+                
+                # Workers have their own extractors; mirror their metrics here
+                self.extractor.processing_times[pdf_path] = processing_time
+                self.extractor.detected_languages.update(
+                    result.get('metadata', {}).get('detected_languages', [])
+                )
+        
+        # Collect statistics in input order
+        for pdf_file in pdf_files:
+            result = results[pdf_file]
             all_results[pdf_file] = result
             total_headings += len(result.get('outline', []))
             detected_languages.update(result.get('metadata', {}).get('detected_languages', []))
+            
+            # As in a serial run, the summary reports the last analyzed document's fonts
+            if font_statistics[pdf_file]:
+                self.extractor.font_analyzer.set_font_statistics(font_statistics[pdf_file])
         
         overall_time = time.time() - overall_start_time
         
         # Save combined results
         combined_output = os.path.join(self.output_dir, 'pdf_outline_results.json')
-        with open(combined_output, 'w', encoding='utf-8') as f:
-            json.dump(all_results, f, indent=2, ensure_ascii=False)
+        _dump_json(all_results, combined_output)
         
         # Generate summary
         summary = {
@@ -115,8 +189,7 @@ class PDFExtractorCLI:
         
         # Save summary
         summary_file = os.path.join(self.output_dir, 'extraction_summary.json')
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        _dump_json(summary, summary_file)
         
         print("\n" + "="*60)
         print("EXTRACTION SUMMARY")
@@ -6,7 +6,11 @@ Contains language patterns, settings, and performance configurations
 from .language_config import (
     LANGUAGE_PATTERNS,
     MULTILINGUAL_HEADING_PATTERNS,
+    MULTILINGUAL_HEADING_PATTERNS_COMPILED,
+    MULTILINGUAL_HEADING_PATTERNS_COMBINED,
     MULTILINGUAL_HEADING_KEYWORDS,
+    MULTILINGUAL_HEADING_KEYWORD_SETS,
+    MULTILINGUAL_HEADING_KEYWORD_PATTERNS,
     PERFORMANCE_SETTINGS,
     OUTPUT_SETTINGS
 )
@@ -14,7 +18,11 @@ from .language_config import (
 __all__ = [
     "LANGUAGE_PATTERNS",
     "MULTILINGUAL_HEADING_PATTERNS", 
+    "MULTILINGUAL_HEADING_PATTERNS_COMPILED",
+    "MULTILINGUAL_HEADING_PATTERNS_COMBINED",
     "MULTILINGUAL_HEADING_KEYWORDS",
+    "MULTILINGUAL_HEADING_KEYWORD_SETS",
+    "MULTILINGUAL_HEADING_KEYWORD_PATTERNS",
     "PERFORMANCE_SETTINGS",
     "OUTPUT_SETTINGS"
 ] 
\ No newline at end of file
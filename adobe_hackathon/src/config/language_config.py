@@ -3,6 +3,8 @@ Language Configuration for Enhanced PDF Outline Extractor
 Contains language patterns, keywords, and settings for multilingual support
 """
 
+import re
+
 # Language detection patterns
 LANGUAGE_PATTERNS = {
     'hi': r'[\u0900-\u097F]',  # Devanagari (Hindi, Marathi, etc.)
@@ -158,6 +160,29 @@ MULTILINGUAL_HEADING_PATTERNS = {
     }
 }
 
+# Heading patterns pre-compiled once at import (same shape as above)
+MULTILINGUAL_HEADING_PATTERNS_COMPILED = {
+    lang: {
+        level: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for level, patterns in levels.items()
+    }
+    for lang, levels in MULTILINGUAL_HEADING_PATTERNS.items()
+}
+
+# One alternation per language and level, so a single match call covers all
+# patterns of that level. Built from the individually compiled patterns above
+# so a broken source pattern fails on its own rather than inside the union.
+MULTILINGUAL_HEADING_PATTERNS_COMBINED = {
+    lang: {
+        level: re.compile(
+            '|'.join(f'(?:{pattern.pattern})' for pattern in patterns),
+            re.IGNORECASE
+        )
+        for level, patterns in levels.items()
+    }
+    for lang, levels in MULTILINGUAL_HEADING_PATTERNS_COMPILED.items()
+}
+
 # Multilingual heading keywords
 MULTILINGUAL_HEADING_KEYWORDS = {
     'en': {
@@ -261,9 +286,22 @@ MULTILINGUAL_HEADING_KEYWORDS = {
     }
 }
 
+# Keyword lookups built once at import: a frozenset for whole-word membership
+# and a single alternation per language for multi-word phrase matching
+MULTILINGUAL_HEADING_KEYWORD_SETS = {
+    lang: frozenset(keywords)
+    for lang, keywords in MULTILINGUAL_HEADING_KEYWORDS.items()
+}
+
+MULTILINGUAL_HEADING_KEYWORD_PATTERNS = {
+    lang: re.compile('|'.join(map(re.escape, sorted(keywords))), re.IGNORECASE)
+    for lang, keywords in MULTILINGUAL_HEADING_KEYWORDS.items()
+}
+
 # Performance settings
 PERFORMANCE_SETTINGS = {
     'heading_score_threshold': 25,  # Minimum score for heading detection
+    'max_heading_length': 120,      # Longer text elements are never headings
     'max_processing_time': 60,      # Maximum processing time in seconds
     'max_memory_usage': 1024,       # Maximum memory usage in MB
     'batch_size': 10,               # Number of documents to process in batch
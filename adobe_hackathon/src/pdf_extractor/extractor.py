@@ -6,21 +6,210 @@ Multilingual PDF structure extraction with Indian language support
 import json
 import sys
 import os
-import re
 import time
-from typing import Dict, List, Tuple, Optional
+import bisect
+import functools
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, Optional
 import fitz  # PyMuPDF
+import numpy as np
 from collections import defaultdict, Counter
 
 from src.config.language_config import (
-    MULTILINGUAL_HEADING_PATTERNS,
-    MULTILINGUAL_HEADING_KEYWORDS,
+    MULTILINGUAL_HEADING_PATTERNS_COMBINED,
+    MULTILINGUAL_HEADING_KEYWORD_SETS,
+    MULTILINGUAL_HEADING_KEYWORD_PATTERNS,
     PERFORMANCE_SETTINGS,
     OUTPUT_SETTINGS
 )
 from src.utils.language_detector import LanguageDetector
 from src.utils.font_analyzer import FontAnalyzer
 
+# Leading characters that earn the heading position bonus: ASCII digits and
+# letters plus the Indic and Arabic script blocks (inclusive codepoint ranges)
+_LEADING_CHAR_RANGES = (
+    (0x0030, 0x0039), (0x0041, 0x005A), (0x0061, 0x007A),
+    (0x0900, 0x097F), (0x0980, 0x09FF), (0x0C00, 0x0C7F), (0x0B80, 0x0BFF),
+    (0x0A80, 0x0AFF), (0x0C80, 0x0CFF), (0x0D00, 0x0D7F), (0x0A00, 0x0A7F),
+    (0x0600, 0x06FF), (0x0B00, 0x0B7F),
+)
+
+
+def _build_codepoint_bitmap(ranges) -> bytes:
+    """Build a bitmap with one bit set per codepoint in the given ranges"""
+    bitmap = bytearray((max(high for _, high in ranges) >> 3) + 1)
+    for low, high in ranges:
+        for codepoint in range(low, high + 1):
+            bitmap[codepoint >> 3] |= 1 << (codepoint & 7)
+    return bytes(bitmap)
+
+
+_LEADING_CHAR_BITMAP = _build_codepoint_bitmap(_LEADING_CHAR_RANGES)
+
+
+def _starts_with_word_char(text: str) -> bool:
+    """Check the first character of text against the leading character bitmap"""
+    if not text:
+        return False
+    codepoint = ord(text[0])
+    index = codepoint >> 3
+    return index < len(_LEADING_CHAR_BITMAP) and bool(_LEADING_CHAR_BITMAP[index] & (1 << (codepoint & 7)))
+
+
+# Regular-weight text smaller than the H3 threshold by more than this is body text
+_H3_SIZE_TOLERANCE = 0.1
+
+# Heading level implied by each font tier (see _font_tier)
+_FONT_TIER_LEVELS = (None, 'H3', 'H2', 'H1', 'H1')
+
+
+def _font_tier_bounds(thresholds: Dict) -> List[float]:
+    """
+    Ascending font size bounds of tiers 1-4 (h3, h2, h1, title), so that
+    bisect_right(bounds, font_size) is the font tier. A missing threshold
+    never matches.
+    """
+    return [thresholds.get(name, math.inf) for name in ('h3', 'h2', 'h1', 'title')]
+
+
+def _make_base_scorer(thresholds: Dict, max_heading_length: int) -> Callable:
+    """
+    Build the font size, bold and length part of the heading score for one
+    document, with its thresholds bound once instead of looked up per element
+    
+    Args:
+        thresholds (Dict): Font size thresholds from the font analysis
+        max_heading_length (int): Longest text that can still be a heading
+        
+    Returns:
+        Callable: scorer(font_size, is_bold, text_length) returning
+        (font_tier, score), or None for text pre-filtered as body text
+    """
+    tier_bounds = _font_tier_bounds(thresholds)
+    h3_floor = tier_bounds[0] - _H3_SIZE_TOLERANCE
+    
+    def base_scorer(font_size: float, is_bold: bool, text_length: int) -> Optional[Tuple[int, float]]:
+        # Fast pre-filter: long lines and regular-weight text below the H3
+        # size are body text, so skip the pattern and keyword work entirely
+        if text_length > max_heading_length or (not is_bold and font_size < h3_floor):
+            return None
+        
+        # Font size score (0-40 points)
+        font_tier = bisect.bisect_right(tier_bounds, font_size)
+        score = 10.0 * font_tier
+        
+        # Bold text bonus (0-20 points)
+        if is_bold:
+            score += 20
+        
+        # Length penalty (headings are usually short)
+        if text_length > 100:
+            score -= 10
+        elif text_length < 3:
+            score -= 20
+        
+        return font_tier, score
+    
+    return base_scorer
+
+
+def _heading_candidate_mask(arrays: 'TextElementArrays', thresholds: Dict,
+                            max_heading_length: int, min_partial_score: float) -> np.ndarray:
+    """
+    Vectorized _make_base_scorer: mark the elements that pass its pre-filter
+    and whose font, bold and length score reaches min_partial_score
+    """
+    font_sizes, is_bold, text_lengths = arrays.font_sizes, arrays.is_bold, arrays.text_lengths
+    tier_bounds = np.asarray(_font_tier_bounds(thresholds), dtype=np.float64)
+    h3_floor = tier_bounds[0] - _H3_SIZE_TOLERANCE
+    
+    font_tiers = np.searchsorted(tier_bounds, font_sizes, side='right')
+    partial_scores = (10 * font_tiers + 20 * is_bold
+                      - np.where(text_lengths > 100, 10, np.where(text_lengths < 3, 20, 0)))
+    passes_filter = (text_lengths <= max_heading_length) & (is_bold | (font_sizes >= h3_floor))
+    return passes_filter & (partial_scores >= min_partial_score)
+
+
+# Default "dict" extraction flags without image blocks
+_TEXT_DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+# Pattern and keyword checks are pure functions of their arguments, so they are
+# memoized at module level (caching bound methods would keep the extractor alive).
+@functools.lru_cache(maxsize=8192)
+def _match_heading_pattern(text_clean: str, level: str, language: str) -> bool:
+    """Cached pattern check behind is_heading_by_pattern_multilingual"""
+    patterns = MULTILINGUAL_HEADING_PATTERNS_COMBINED.get(
+        language, MULTILINGUAL_HEADING_PATTERNS_COMBINED['en']
+    )
+    
+    level_pattern = patterns.get(level.lower())
+    if level_pattern is None:
+        return False
+    
+    return level_pattern.match(text_clean) is not None
+
+
+# Combined pattern per heading level for each language, in H1, H2, H3 order,
+# so a level lookup resolves the language's patterns only once
+_LEVEL_PATTERNS = {
+    lang: tuple((level.upper(), levels[level]) for level in ('h1', 'h2', 'h3') if level in levels)
+    for lang, levels in MULTILINGUAL_HEADING_PATTERNS_COMBINED.items()
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _match_heading_level(text_clean: str, language: str) -> Optional[str]:
+    """Cached lookup of the first heading level whose patterns match"""
+    for level, level_pattern in _LEVEL_PATTERNS.get(language, _LEVEL_PATTERNS['en']):
+        if level_pattern.match(text_clean):
+            return level
+    return None
+
+
+@functools.lru_cache(maxsize=8192)
+def _match_heading_keywords(text_lower: str, language: str) -> bool:
+    """Cached keyword check behind is_heading_by_keywords_multilingual"""
+    if language not in MULTILINGUAL_HEADING_KEYWORD_SETS:
+        language = 'en'
+    
+    # Check if any word is a heading keyword
+    if not MULTILINGUAL_HEADING_KEYWORD_SETS[language].isdisjoint(text_lower.split()):
+        return True
+    
+    # Check for common heading phrases
+    return MULTILINGUAL_HEADING_KEYWORD_PATTERNS[language].search(text_lower) is not None
+
+
+@dataclass
+class TextElementArrays:
+    """Struct-of-arrays view of the text element fields used for font analysis and scoring"""
+    font_sizes: np.ndarray    # float64
+    font_names: np.ndarray    # str
+    is_bold: np.ndarray       # bool
+    pages: np.ndarray         # int32
+    text_lengths: np.ndarray  # int64
+    
+    @classmethod
+    def from_elements(cls, text_elements: List[Dict]) -> 'TextElementArrays':
+        """Build the arrays from a list of text element dicts in a single pass"""
+        count = len(text_elements)
+        font_sizes = np.empty(count, dtype=np.float64)
+        is_bold = np.empty(count, dtype=bool)
+        pages = np.empty(count, dtype=np.int32)
+        text_lengths = np.empty(count, dtype=np.int64)
+        font_names = []
+        
+        for index, elem in enumerate(text_elements):
+            font_sizes[index] = elem['font_size']
+            font_names.append(elem.get('font_name', 'Unknown'))
+            is_bold[index] = elem['is_bold']
+            pages[index] = elem['page']
+            text_lengths[index] = len(elem['text'])
+        
+        return cls(font_sizes, np.array(font_names), is_bold, pages, text_lengths)
+
 
 class MultilingualPDFOutlineExtractor:
     """
@@ -39,6 +228,7 @@ class MultilingualPDFOutlineExtractor:
         
         # Settings
         self.heading_score_threshold = PERFORMANCE_SETTINGS['heading_score_threshold']
+        self.max_heading_length = PERFORMANCE_SETTINGS['max_heading_length']
         self.max_processing_time = PERFORMANCE_SETTINGS['max_processing_time']
     
     def extract_text_elements(self, pdf_path: str) -> List[Dict]:
@@ -52,53 +242,68 @@ class MultilingualPDFOutlineExtractor:
             List[Dict]: List of text elements with formatting information
         """
         try:
-            doc = fitz.open(pdf_path)
             text_elements = []
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Get text blocks with formatting
-                blocks = page.get_text("dict")
-                
-                for block in blocks["blocks"]:
-                    if "lines" in block:  # Text block
-                        for line in block["lines"]:
-                            line_text = ""
-                            spans_info = []
-                            
-                            for span in line["spans"]:
-                                text = span["text"].strip()
-                                if text:
-                                    line_text += text + " "
-                                    spans_info.append(span)
-                            
-                            if line_text.strip() and spans_info:
-                                # Use the most common font size in the line
-                                font_sizes = [span["size"] for span in spans_info]
-                                avg_font_size = sum(font_sizes) / len(font_sizes)
+            # The context manager closes the document even if a page fails to parse
+            with fitz.open(pdf_path, filetype="pdf") as doc:
+                for page in doc:
+                    page_num = page.number
+                    
+                    # Get text blocks with formatting (image blocks are never used)
+                    blocks = page.get_text("dict", flags=_TEXT_DICT_FLAGS)
+                    
+                    for block in blocks["blocks"]:
+                        if "lines" in block:  # Text block
+                            for line in block["lines"]:
+                                spans = line["spans"]
                                 
-                                # Check if any span is bold
-                                is_bold = any(span["flags"] & 2**4 for span in spans_info)
-                                
-                                # Get font name from the first span
-                                font_name = spans_info[0]["font"] if spans_info else "Unknown"
-                                
-                                # Detect language for this text element
-                                detected_lang = self.language_detector.detect_language(line_text.strip())
-                                self.detected_languages.add(detected_lang)
+                                if len(spans) == 1:
+                                    # Fast path: most lines hold a single span
+                                    first_span = spans[0]
+                                    element_text = first_span["text"].strip()
+                                    if not element_text:
+                                        continue
+                                    
+                                    avg_font_size = first_span["size"]
+                                    is_bold = bool(first_span["flags"] & 2**4)
+                                else:
+                                    span_texts = []
+                                    spans_info = []
+                                    
+                                    for span in spans:
+                                        text = span["text"].strip()
+                                        if text:
+                                            span_texts.append(text)
+                                            spans_info.append(span)
+                                    
+                                    if not spans_info:
+                                        continue
+                                    
+                                    first_span = spans_info[0]
+                                    element_text = " ".join(span_texts)
+                                    
+                                    # Use the most common font size in the line
+                                    font_sizes = [span["size"] for span in spans_info]
+                                    avg_font_size = sum(font_sizes) / len(font_sizes)
+                                    
+                                    # Check if any span is bold
+                                    is_bold = any(span["flags"] & 2**4 for span in spans_info)
                                 
+                                # Font name and position come from the first span
                                 text_elements.append({
-                                    'text': line_text.strip(),
+                                    'text': element_text,
+                                    'text_norm': element_text.lower(),  # Shared by keyword checks and dedup
                                     'font_size': round(avg_font_size, 1),
-                                    'font_name': font_name,
+                                    'font_name': first_span["font"],
                                     'is_bold': is_bold,
                                     'page': page_num + 1,
-                                    'bbox': spans_info[0]["bbox"],
-                                    'language': detected_lang
+                                    'bbox': first_span["bbox"],
+                                    'language': None  # Detected lazily for heading candidates
                                 })
+                    
+                    # Release this page's text dict before extracting the next one
+                    del blocks
             
-            doc.close()
             return text_elements
             
         except Exception as e:
@@ -117,23 +322,7 @@ class MultilingualPDFOutlineExtractor:
         Returns:
             bool: True if text matches heading patterns
         """
-        text_clean = text.strip()
-        patterns = MULTILINGUAL_HEADING_PATTERNS.get(language, MULTILINGUAL_HEADING_PATTERNS['en'])
-        
-        if level == 'H1':
-            level_patterns = patterns.get('h1', [])
-        elif level == 'H2':
-            level_patterns = patterns.get('h2', [])
-        elif level == 'H3':
-            level_patterns = patterns.get('h3', [])
-        else:
-            return False
-        
-        for pattern in level_patterns:
-            if re.match(pattern, text_clean, re.IGNORECASE):
-                return True
-        
-        return False
+        return _match_heading_pattern(text.strip(), level, language)
     
     def is_heading_by_keywords_multilingual(self, text: str, language: str) -> bool:
         """
@@ -146,76 +335,94 @@ class MultilingualPDFOutlineExtractor:
         Returns:
             bool: True if text contains heading keywords
         """
-        text_lower = text.lower()
-        keywords = MULTILINGUAL_HEADING_KEYWORDS.get(language, MULTILINGUAL_HEADING_KEYWORDS['en'])
-        
-        # Check if any word is a heading keyword
-        words = text_lower.split()
-        for word in words:
-            if word in keywords:
-                return True
-        
-        # Check for common heading phrases
-        for keyword in keywords:
-            if keyword in text_lower:
-                return True
+        return _match_heading_keywords(text.lower(), language)
+    
+    def detect_element_language(self, element: Dict) -> str:
+        """
+        Return the language of a text element, detecting and caching it on first use
         
-        return False
+        Args:
+            element (Dict): Text element with formatting information
+            
+        Returns:
+            str: Language code
+        """
+        language = element.get('language')
+        if language is None:
+            language = self.language_detector.detect_language(element['text'])
+            element['language'] = language
+            self.detected_languages.add(language)
+        return language
     
-    def calculate_heading_score_multilingual(self, element: Dict, stats: Dict) -> float:
+    def _font_tier(self, font_size: float, thresholds: Dict) -> int:
+        """Rank a font size against the thresholds: 4 (title) down to 0 (body)"""
+        return bisect.bisect_right(_font_tier_bounds(thresholds), font_size)
+    
+    def _match_pattern_level(self, text: str, language: str) -> Optional[str]:
+        """Return the first heading level whose patterns match the text"""
+        return _match_heading_level(text.strip(), language)
+    
+    def _score_and_level(self, element: Dict, stats: Dict,
+                         base_scorer: Optional[Callable] = None) -> Tuple[float, Optional[str]]:
         """
-        Calculate a score indicating how likely this element is a heading
+        Score a text element and determine its heading level in a single pass
         
         Args:
             element (Dict): Text element with formatting information
             stats (Dict): Font analysis statistics
+            base_scorer (Optional[Callable]): Scorer from _make_base_scorer for
+                these stats; built on the fly when not given
             
         Returns:
-            float: Heading confidence score (0-100)
+            Tuple[float, Optional[str]]: Heading confidence score (0-100) and
+            heading level ('H1', 'H2', 'H3') or None
         """
         text = element['text']
-        font_size = element['font_size']
-        is_bold = element['is_bold']
-        language = element.get('language', 'en')
         
-        score = 0.0
+        if base_scorer is None:
+            base_scorer = _make_base_scorer(stats.get('thresholds', {}), self.max_heading_length)
         
-        # Font size score (0-40 points)
-        thresholds = stats.get('thresholds', {})
-        if font_size >= thresholds.get('title', font_size + 2):
-            score += 40
-        elif font_size >= thresholds.get('h1', font_size + 1.5):
-            score += 30
-        elif font_size >= thresholds.get('h2', font_size + 1.0):
-            score += 20
-        elif font_size >= thresholds.get('h3', font_size + 0.5):
-            score += 10
+        # Font size, bold and length scores (None when pre-filtered as body text)
+        base = base_scorer(element['font_size'], element['is_bold'], len(text))
+        if base is None:
+            return 0.0, None
+        font_tier, score = base
+        font_level = _FONT_TIER_LEVELS[font_tier]
         
-        # Bold text bonus (0-20 points)
-        if is_bold:
-            score += 20
+        # Position bonus (headings often start with numbers or letters)
+        if _starts_with_word_char(text):
+            score += 5
+        
+        # Pattern and keyword matches add at most 30 points; skip language
+        # detection when the threshold is out of reach even with both
+        if element.get('language') is None and score + 30 < self.heading_score_threshold:
+            return max(0, score), font_level
+        language = self.detect_element_language(element)
         
-        # Pattern matching score (0-20 points)
-        for level in ['H1', 'H2', 'H3']:
-            if self.is_heading_by_pattern_multilingual(text, level, language):
-                score += 20
-                break
+        # Pattern matching score (0-20 points); a matching pattern also decides the level
+        pattern_level = self._match_pattern_level(text, language)
+        if pattern_level:
+            score += 20
         
         # Keyword matching score (0-10 points)
-        if self.is_heading_by_keywords_multilingual(text, language):
+        text_norm = element.get('text_norm') or text.strip().lower()
+        if _match_heading_keywords(text_norm, language):
             score += 10
         
-        # Length penalty (headings are usually short)
-        if len(text) > 100:
-            score -= 10
-        elif len(text) < 3:
-            score -= 20
-        
-        # Position bonus (headings often start with numbers or letters)
-        if re.match(r'^[A-Za-z0-9\u0900-\u097F\u0980-\u09FF\u0C00-\u0C7F\u0B80-\u0BFF\u0A80-\u0AFF\u0C80-\u0CFF\u0D00-\u0D7F\u0A00-\u0A7F\u0600-\u06FF\u0B00-\u0B7F]', text):
-            score += 5
+        return max(0, score), pattern_level or font_level
+    
+    def calculate_heading_score_multilingual(self, element: Dict, stats: Dict) -> float:
+        """
+        Calculate a score indicating how likely this element is a heading
         
-        return max(0, score)
+        Args:
+            element (Dict): Text element with formatting information
+            stats (Dict): Font analysis statistics
+            
+        Returns:
+            float: Heading confidence score (0-100)
+        """
+        return self._score_and_level(element, stats)[0]
     
     def determine_heading_level_multilingual(self, element: Dict, stats: Dict) -> Optional[str]:
         """
@@ -228,38 +435,25 @@ class MultilingualPDFOutlineExtractor:
         Returns:
             Optional[str]: Heading level ('H1', 'H2', 'H3') or None
         """
-        font_size = element['font_size']
-        text = element['text']
-        language = element.get('language', 'en')
+        language = self.detect_element_language(element)
         
-        # Check patterns first
-        if self.is_heading_by_pattern_multilingual(text, 'H1', language):
-            return 'H1'
-        elif self.is_heading_by_pattern_multilingual(text, 'H2', language):
-            return 'H2'
-        elif self.is_heading_by_pattern_multilingual(text, 'H3', language):
-            return 'H3'
+        # Check patterns first, then fall back to font size thresholds
+        pattern_level = self._match_pattern_level(element['text'], language)
+        if pattern_level:
+            return pattern_level
         
-        # Use font size thresholds
-        thresholds = stats.get('thresholds', {})
-        if font_size >= thresholds.get('title', font_size + 2):
-            return 'H1'
-        elif font_size >= thresholds.get('h1', font_size + 1.5):
-            return 'H1'
-        elif font_size >= thresholds.get('h2', font_size + 1.0):
-            return 'H2'
-        elif font_size >= thresholds.get('h3', font_size + 0.5):
-            return 'H3'
-        
-        return None
+        return _FONT_TIER_LEVELS[self._font_tier(element['font_size'], stats.get('thresholds', {}))]
     
-    def extract_title_multilingual(self, text_elements: List[Dict], stats: Dict) -> str:
+    def extract_title_multilingual(self, text_elements: List[Dict], stats: Dict,
+                                   arrays: Optional[TextElementArrays] = None) -> str:
         """
         Extract the document title with multilingual support
         
         Args:
             text_elements (List[Dict]): List of text elements
             stats (Dict): Font analysis statistics
+            arrays (Optional[TextElementArrays]): Array view of text_elements,
+                built on the fly when not given
             
         Returns:
             str: Document title
@@ -267,48 +461,69 @@ class MultilingualPDFOutlineExtractor:
         if not text_elements:
             return "Untitled Document"
         
-        # Look for the largest font size element on the first page
-        first_page_elements = [elem for elem in text_elements if elem['page'] == 1]
+        if arrays is None:
+            arrays = TextElementArrays.from_elements(text_elements)
         
-        if not first_page_elements:
+        # Look for the largest font size element on the first page
+        first_page = arrays.pages == 1
+        if not first_page.any():
             return "Untitled Document"
         
-        # Sort by font size (descending) and score
-        candidates = []
-        for elem in first_page_elements:
-            score = self.calculate_heading_score_multilingual(elem, stats)
-            candidates.append((elem, score))
+        max_font_size = arrays.font_sizes[first_page].max()
+        candidates = np.flatnonzero(first_page & (arrays.font_sizes == max_font_size))
         
-        candidates.sort(key=lambda x: (x[0]['font_size'], x[1]), reverse=True)
+        # Break font size ties by heading score; the first element wins equal scores
+        base_scorer = _make_base_scorer(stats.get('thresholds', {}), self.max_heading_length)
+        best_index = max(
+            candidates.tolist(),
+            key=lambda index: self._score_and_level(text_elements[index], stats, base_scorer)[0]
+        )
         
-        # Return the best candidate
-        if candidates:
-            return candidates[0][0]['text']
-        
-        return "Untitled Document"
+        return text_elements[best_index]['text']
     
-    def extract_headings_multilingual(self, text_elements: List[Dict], stats: Dict) -> List[Dict]:
+    def extract_headings_multilingual(self, text_elements: List[Dict], stats: Dict,
+                                      arrays: Optional[TextElementArrays] = None) -> List[Dict]:
         """
         Extract headings from the document with multilingual support
         
         Args:
             text_elements (List[Dict]): List of text elements
             stats (Dict): Font analysis statistics
+            arrays (Optional[TextElementArrays]): Array view of text_elements,
+                built on the fly when not given
             
         Returns:
             List[Dict]: List of extracted headings
         """
-        headings = []
+        unique_headings = []
+        seen_texts = set()
+        
+        if not text_elements:
+            return unique_headings
+        
+        if arrays is None:
+            arrays = TextElementArrays.from_elements(text_elements)
         
-        for element in text_elements:
-            score = self.calculate_heading_score_multilingual(element, stats)
+        # Position, pattern and keyword bonuses add at most 35 points; only
+        # elements whose font, bold and length score can still reach the
+        # threshold are scored in full
+        thresholds = stats.get('thresholds', {})
+        candidates = np.flatnonzero(_heading_candidate_mask(
+            arrays, thresholds, self.max_heading_length, self.heading_score_threshold - 35
+        ))
+        
+        base_scorer = _make_base_scorer(thresholds, self.max_heading_length)
+        for index in candidates.tolist():
+            element = text_elements[index]
+            score, level = self._score_and_level(element, stats, base_scorer)
             
             # Only consider elements with a good heading score
-            if score >= self.heading_score_threshold:
-                level = self.determine_heading_level_multilingual(element, stats)
-                
-                if level:
-                    headings.append({
+            if score >= self.heading_score_threshold and level:
+                # Skip duplicates of a heading that was already extracted
+                text_normalized = element.get('text_norm') or element['text'].strip().lower()
+                if text_normalized not in seen_texts:
+                    seen_texts.add(text_normalized)
+                    unique_headings.append({
                         'level': level,
                         'text': element['text'],
                         'page': element['page'],
@@ -318,16 +533,6 @@ class MultilingualPDFOutlineExtractor:
                         'confidence_score': float(score)
                     })
         
-        # Remove duplicates and sort by page, then by level
-        unique_headings = []
-        seen_texts = set()
-        
-        for heading in headings:
-            text_normalized = heading['text'].strip().lower()
-            if text_normalized not in seen_texts:
-                seen_texts.add(text_normalized)
-                unique_headings.append(heading)
-        
         # Sort by page number, then by level hierarchy
         level_order = {'H1': 1, 'H2': 2, 'H3': 3}
         unique_headings.sort(key=lambda x: (x['page'], level_order.get(x['level'], 4)))
@@ -346,6 +551,11 @@ class MultilingualPDFOutlineExtractor:
         """
         start_time = time.time()
         
+        # Keep the detection caches bounded to the current document
+        _match_heading_pattern.cache_clear()
+        _match_heading_level.cache_clear()
+        _match_heading_keywords.cache_clear()
+        
         try:
             # Extract text elements
             text_elements = self.extract_text_elements(pdf_path)
@@ -363,12 +573,12 @@ class MultilingualPDFOutlineExtractor:
                     }
                 }
             
-            # Analyze font distribution
-            stats = self.font_analyzer.analyze_font_distribution(text_elements)
-            
-            # Extract title and headings
-            title = self.extract_title_multilingual(text_elements, stats)
-            headings = self.extract_headings_multilingual(text_elements, stats)
+            # Analyze font distribution and extract title and headings from a
+            # shared array view of the elements
+            arrays = TextElementArrays.from_elements(text_elements)
+            stats = self.font_analyzer.analyze_distribution_soa(arrays.font_sizes, arrays.font_names)
+            title = self.extract_title_multilingual(text_elements, stats, arrays)
+            headings = self.extract_headings_multilingual(text_elements, stats, arrays)
             
             # Calculate processing time
             processing_time = time.time() - start_time
@@ -376,7 +586,7 @@ class MultilingualPDFOutlineExtractor:
             
             # Add metadata
             metadata = {
-                "pages": max(elem['page'] for elem in text_elements) if text_elements else 0,
+                "pages": int(arrays.pages.max()),
                 "text_elements": len(text_elements),
                 "body_font_size": stats.get('body_font_size', 0),
                 "unique_font_sizes": stats.get('unique_font_sizes', 0),
@@ -387,7 +597,7 @@ class MultilingualPDFOutlineExtractor:
                 "processing_time": round(processing_time, 2),
                 "language_detection_methods": self.language_detector.detection_methods,
                 "font_statistics": stats.get('statistics', {}),
-                "font_consistency": self.font_analyzer.analyze_font_consistency(text_elements)
+                "font_consistency": self.font_analyzer.analyze_consistency_soa(arrays.font_sizes, arrays.font_names)
             }
             
             return {
@@ -423,6 +633,7 @@ class MultilingualPDFOutlineExtractor:
             "font_statistics": self.font_analyzer.get_font_statistics(),
             "settings": {
                 "heading_score_threshold": self.heading_score_threshold,
+                "max_heading_length": self.max_heading_length,
                 "max_processing_time": self.max_processing_time
             }
         } 
\ No newline at end of file
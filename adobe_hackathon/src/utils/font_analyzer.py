@@ -3,9 +3,14 @@ Font Analysis Utilities for Enhanced PDF Outline Extractor
 Provides font size analysis and statistical calculations
 """
 
-import statistics
-from typing import Dict, List
-from collections import Counter
+import hashlib
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Level names indexed by the codes returned by FontAnalyzer.classify_headings_batch
+HEADING_LEVEL_NAMES = ('body', 'H1', 'H2', 'H3')
 
 
 class FontAnalyzer:
@@ -13,6 +18,10 @@ class FontAnalyzer:
     
     def __init__(self):
         self.font_stats = {}
+        # Heading thresholds of the last analysis (inf: nothing is a heading)
+        self._t_h1 = self._t_h2 = self._t_h3 = math.inf
+        # Digest of the sizes and names behind font_stats
+        self._stats_key = None
     
     def analyze_font_distribution(self, text_elements: List[Dict]) -> Dict:
         """
@@ -27,22 +36,58 @@ class FontAnalyzer:
         if not text_elements:
             return {}
         
-        # Extract font sizes and names
-        font_sizes = [elem['font_size'] for elem in text_elements]
-        font_names = [elem.get('font_name', 'Unknown') for elem in text_elements]
-        font_sizes.sort()
+        # Extract font sizes and names into parallel arrays
+        font_sizes = np.fromiter((elem['font_size'] for elem in text_elements),
+                                 dtype=np.float64, count=len(text_elements))
+        font_names = np.array([elem.get('font_name', 'Unknown') for elem in text_elements])
+        return self.analyze_distribution_soa(font_sizes, font_names)
+    
+    def analyze_distribution_soa(self, font_sizes: np.ndarray, font_names: np.ndarray) -> Dict:
+        """
+        Analyze font size distribution from parallel arrays of sizes and names
         
-        # Calculate basic statistics
-        mean_size = statistics.mean(font_sizes)
-        std_size = statistics.stdev(font_sizes) if len(font_sizes) > 1 else 0
-        median_size = statistics.median(font_sizes)
+        Args:
+            font_sizes (np.ndarray): Font size of each text element
+            font_names (np.ndarray): Font name of each text element
+            
+        Returns:
+            Dict: Font analysis statistics and thresholds
+        """
+        if font_sizes.size == 0:
+            return {}
         
-        # Find the most common font size (likely body text)
-        size_counts = Counter(font_sizes)
-        body_font_size = size_counts.most_common(1)[0][0]
+        # Repeated analysis of the same input returns the stored statistics;
+        # the arrays are hashed in place rather than copied
+        font_sizes = np.ascontiguousarray(font_sizes, dtype=np.float64)
+        font_names = np.ascontiguousarray(font_names, dtype=str)
+        digest = hashlib.blake2b(f'{font_sizes.size}:{font_names.dtype.str}'.encode(), digest_size=16)
+        digest.update(font_sizes)
+        digest.update(font_names)
+        stats_key = digest.digest()
+        if stats_key == self._stats_key:
+            return self.font_stats
         
-        # Analyze font names
-        font_counter = Counter(font_names)
+        sizes = np.sort(font_sizes)
+        
+        # Calculate basic statistics; everything below reuses the one sort
+        n = sizes.size
+        mean_size = float(sizes.mean())
+        std_size = float(np.sqrt(np.square(sizes - mean_size).sum() / (n - 1))) if n > 1 else 0
+        median_size = float(sizes[(n - 1) // 2] + sizes[n // 2]) / 2
+        
+        # Size counts from the run lengths of the sorted sizes
+        run_starts = np.flatnonzero(np.diff(sizes, prepend=-np.inf))
+        unique_sizes = sizes[run_starts]
+        size_counts = np.diff(run_starts, append=n)
+        
+        # Find the most common font size (likely body text); ties go to the smallest size
+        body_font_size = float(unique_sizes[size_counts.argmax()])
+        
+        # Analyze font names: top 5 by count, ties in order of first appearance
+        name_values, first_seen, name_codes = np.unique(font_names, return_index=True,
+                                                        return_inverse=True)
+        name_counts = np.bincount(name_codes.ravel(), minlength=name_values.size)
+        top_names = np.lexsort((first_seen, -name_counts))[:5]
         
         # Determine thresholds based on standard deviations
         thresholds = {
@@ -54,33 +99,35 @@ class FontAnalyzer:
             'small': body_font_size - 0.5 * std_size
         }
         
-        # Calculate percentiles
+        # Calculate percentiles by index into the sorted sizes
+        font_sizes = sizes.tolist()
         percentiles = {
-            'p10': statistics.quantiles(font_sizes, n=10)[0] if len(font_sizes) > 1 else font_sizes[0],
-            'p25': statistics.quantiles(font_sizes, n=4)[0] if len(font_sizes) > 1 else font_sizes[0],
+            'p10': font_sizes[n // 10],
+            'p25': font_sizes[n // 4],
             'p50': median_size,
-            'p75': statistics.quantiles(font_sizes, n=4)[2] if len(font_sizes) > 1 else font_sizes[-1],
-            'p90': statistics.quantiles(font_sizes, n=10)[8] if len(font_sizes) > 1 else font_sizes[-1]
+            'p75': font_sizes[3 * n // 4],
+            'p90': font_sizes[9 * n // 10]
         }
         
         # Store analysis results
-        self.font_stats = {
+        self.set_font_statistics({
             'body_font_size': body_font_size,
             'thresholds': thresholds,
             'font_sizes': font_sizes,
-            'size_counts': dict(size_counts),
-            'font_distribution': dict(font_counter.most_common(5)),
-            'unique_font_sizes': len(set(font_sizes)),
+            'size_counts': dict(zip(unique_sizes.tolist(), size_counts.tolist())),
+            'font_distribution': dict(zip(name_values[top_names].tolist(),
+                                          name_counts[top_names].tolist())),
+            'unique_font_sizes': len(unique_sizes),
             'statistics': {
                 'mean': mean_size,
                 'median': median_size,
                 'std_dev': std_size,
-                'min': min(font_sizes),
-                'max': max(font_sizes),
-                'range': max(font_sizes) - min(font_sizes)
+                'min': font_sizes[0],
+                'max': font_sizes[-1],
+                'range': font_sizes[-1] - font_sizes[0]
             },
             'percentiles': percentiles
-        }
+        }, stats_key)
         
         return self.font_stats
     
@@ -102,8 +149,7 @@ class FontAnalyzer:
         Returns:
             bool: True if likely a heading
         """
-        thresholds = self.get_font_thresholds()
-        return font_size >= thresholds.get('h3', font_size + 1)
+        return font_size >= self._t_h3
     
     def get_heading_level(self, font_size: float) -> str:
         """
@@ -115,23 +161,53 @@ class FontAnalyzer:
         Returns:
             str: Heading level ('H1', 'H2', 'H3', or 'body')
         """
-        thresholds = self.get_font_thresholds()
-        
-        if font_size >= thresholds.get('title', font_size + 2):
-            return 'H1'
-        elif font_size >= thresholds.get('h1', font_size + 1.5):
+        # The title threshold is never below h1, so it needs no separate check
+        if font_size >= self._t_h1:
             return 'H1'
-        elif font_size >= thresholds.get('h2', font_size + 1.0):
+        elif font_size >= self._t_h2:
             return 'H2'
-        elif font_size >= thresholds.get('h3', font_size + 0.5):
+        elif font_size >= self._t_h3:
             return 'H3'
         else:
             return 'body'
     
+    def classify_headings_batch(self, font_sizes: np.ndarray) -> np.ndarray:
+        """
+        Determine heading levels for many font sizes at once
+        
+        Args:
+            font_sizes (np.ndarray): Font sizes to classify
+            
+        Returns:
+            np.ndarray: int8 codes indexing HEADING_LEVEL_NAMES, matching
+            get_heading_level for each size
+        """
+        font_sizes = np.asarray(font_sizes, dtype=np.float64)
+        return np.select(
+            [font_sizes >= self._t_h1, font_sizes >= self._t_h2, font_sizes >= self._t_h3],
+            [1, 2, 3], 0
+        ).astype(np.int8)
+    
     def get_font_statistics(self) -> Dict:
         """Get comprehensive font statistics"""
         return self.font_stats
     
+    def set_font_statistics(self, font_stats: Dict, stats_key: Optional[bytes] = None):
+        """
+        Install font statistics, e.g. ones computed by another process
+        
+        Args:
+            font_stats (Dict): Statistics as returned by analyze_distribution_soa
+            stats_key (Optional[bytes]): Digest of the analyzed input, if known;
+                without it the next analysis always recomputes
+        """
+        thresholds = font_stats.get('thresholds', {})
+        self.font_stats = font_stats
+        self._t_h1 = thresholds.get('h1', math.inf)
+        self._t_h2 = thresholds.get('h2', math.inf)
+        self._t_h3 = thresholds.get('h3', math.inf)
+        self._stats_key = stats_key
+    
     def analyze_font_consistency(self, text_elements: List[Dict]) -> Dict:
         """
         Analyze font consistency across the document
@@ -145,24 +221,51 @@ class FontAnalyzer:
         if not text_elements:
             return {}
         
-        # Group by font name
-        font_groups = {}
-        for elem in text_elements:
-            font_name = elem.get('font_name', 'Unknown')
-            if font_name not in font_groups:
-                font_groups[font_name] = []
-            font_groups[font_name].append(elem['font_size'])
+        font_sizes = np.fromiter((elem['font_size'] for elem in text_elements),
+                                 dtype=np.float64, count=len(text_elements))
+        font_names = np.array([elem.get('font_name', 'Unknown') for elem in text_elements])
+        return self.analyze_consistency_soa(font_sizes, font_names)
+    
+    def analyze_consistency_soa(self, font_sizes: np.ndarray, font_names: np.ndarray) -> Dict:
+        """
+        Analyze font consistency from parallel arrays of sizes and names
+        
+        Args:
+            font_sizes (np.ndarray): Font size of each text element
+            font_names (np.ndarray): Font name of each text element
+            
+        Returns:
+            Dict: Font consistency analysis, keyed by font name in order of first appearance
+        """
+        if font_sizes.size == 0:
+            return {}
+        
+        # Group by font name: every per-font statistic is one grouped reduction
+        sizes = font_sizes.astype(np.float64, copy=False)
+        names, first_seen, codes = np.unique(font_names, return_index=True, return_inverse=True)
+        codes = codes.ravel()
+        counts = np.bincount(codes, minlength=names.size)
+        means = np.bincount(codes, weights=sizes, minlength=names.size) / counts
+        squared_deviations = np.bincount(codes, weights=np.square(sizes - means[codes]),
+                                         minlength=names.size)
+        std_sizes = np.sqrt(squared_deviations / np.maximum(counts - 1, 1))
+        min_sizes = np.full(names.size, np.inf)
+        max_sizes = np.full(names.size, -np.inf)
+        np.minimum.at(min_sizes, codes, sizes)
+        np.maximum.at(max_sizes, codes, sizes)
         
         # Analyze each font group
         font_analysis = {}
-        for font_name, sizes in font_groups.items():
-            font_analysis[font_name] = {
-                'count': len(sizes),
-                'mean_size': statistics.mean(sizes),
-                'std_size': statistics.stdev(sizes) if len(sizes) > 1 else 0,
-                'min_size': min(sizes),
-                'max_size': max(sizes),
-                'size_range': max(sizes) - min(sizes)
+        for index in np.argsort(first_seen).tolist():
+            count = int(counts[index])
+            min_size, max_size = float(min_sizes[index]), float(max_sizes[index])
+            font_analysis[str(names[index])] = {
+                'count': count,
+                'mean_size': float(means[index]),
+                'std_size': float(std_sizes[index]) if count > 1 else 0,
+                'min_size': min_size,
+                'max_size': max_size,
+                'size_range': max_size - min_size
             }
         
-        return font_analysis 
\ No newline at end of file
+        return font_analysis
@@ -3,7 +3,10 @@ Language Detection Utilities for Enhanced PDF Outline Extractor
 Provides multilingual language detection capabilities
 """
 
+import importlib.util
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional
 
 # Language detection imports
@@ -14,30 +17,139 @@ try:
 except ImportError:
     LANGDETECT_AVAILABLE = False
 
-try:
-    import langid
-    LANGID_AVAILABLE = True
-except ImportError:
-    LANGID_AVAILABLE = False
+# langid loads its model on import, so it is only imported if actually used
+LANGID_AVAILABLE = importlib.util.find_spec('langid') is not None
 
 from src.config.language_config import LANGUAGE_PATTERNS
 
+# Unicode blocks of the scripts in LANGUAGE_PATTERNS, sorted by start codepoint.
+# Blocks shared by several languages map to the one LANGUAGE_PATTERNS lists first.
+SCRIPT_BLOCKS = (
+    (0x0041, 0x005A, 'en'),  # Latin capitals
+    (0x0061, 0x007A, 'en'),  # Latin small letters
+    (0x0400, 0x04FF, 'ru'),  # Cyrillic
+    (0x0600, 0x06FF, 'ur'),  # Arabic script
+    (0x0900, 0x097F, 'hi'),  # Devanagari
+    (0x0980, 0x09FF, 'bn'),  # Bengali
+    (0x0A00, 0x0A7F, 'pa'),  # Gurmukhi
+    (0x0A80, 0x0AFF, 'gu'),  # Gujarati
+    (0x0B00, 0x0B7F, 'or'),  # Odia
+    (0x0B80, 0x0BFF, 'ta'),  # Tamil
+    (0x0C00, 0x0C7F, 'te'),  # Telugu
+    (0x0C80, 0x0CFF, 'kn'),  # Kannada
+    (0x0D00, 0x0D7F, 'ml'),  # Malayalam
+    (0x0E00, 0x0E7F, 'th'),  # Thai
+    (0x3040, 0x30FF, 'ja'),  # Hiragana and Katakana
+    (0x4E00, 0x9FFF, 'zh'),  # CJK ideographs
+    (0xAC00, 0xD7AF, 'ko'),  # Hangul syllables
+)
+_SCRIPT_BLOCK_STARTS = [low for low, _, _ in SCRIPT_BLOCKS]
+
+# Number of leading characters sampled by the script scan
+SCRIPT_SCAN_LENGTH = 256
+
+# Detection results are cached per text prefix of this length
+DETECTION_PREFIX_LENGTH = 128
+DETECTION_CACHE_SIZE = 4096
+
+# Language groupings reported by LanguageDetector.get_supported_languages
+SUPPORTED_LANGUAGES = tuple(LANGUAGE_PATTERNS)
+INDIAN_LANGUAGES = ('hi', 'bn', 'te', 'ta', 'gu', 'kn', 'ml', 'pa', 'ur', 'or', 'as', 'mr', 'sa')
+INTERNATIONAL_LANGUAGES = ('en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'zh', 'ja', 'ko', 'ar', 'th')
+_INDIAN_LANGUAGE_SET = frozenset(INDIAN_LANGUAGES)
+
+LANGUAGE_NAMES = {
+    'hi': 'Hindi',
+    'bn': 'Bengali',
+    'te': 'Telugu',
+    'ta': 'Tamil',
+    'gu': 'Gujarati',
+    'kn': 'Kannada',
+    'ml': 'Malayalam',
+    'pa': 'Punjabi',
+    'ur': 'Urdu',
+    'or': 'Odia',
+    'as': 'Assamese',
+    'mr': 'Marathi',
+    'sa': 'Sanskrit',
+    'en': 'English',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ru': 'Russian',
+    'zh': 'Chinese',
+    'ja': 'Japanese',
+    'ko': 'Korean',
+    'ar': 'Arabic',
+    'th': 'Thai'
+}
+
+
+def _detect_by_script(text: str) -> Optional[str]:
+    """
+    Detect language from the dominant Unicode script of the leading characters
+    
+    Any non-Latin script outweighs Latin letters, so mixed text such as
+    "Hindi हिंदी" is still detected as the non-Latin language.
+    
+    Args:
+        text (str): Text to scan
+        
+    Returns:
+        Optional[str]: Language code of the majority script, or None if no
+        character falls in SCRIPT_BLOCKS
+    """
+    sample = text[:SCRIPT_SCAN_LENGTH]
+    
+    # Pure ASCII text (most PDF body text) can only contain Latin letters;
+    # ASCII has letters exactly when case mapping changes the string
+    if sample.isascii():
+        return 'en' if sample.lower() != sample.upper() else None
+    
+    # Text runs in one script, so the last matched block is tried before the bisect
+    counts = {}
+    low, high, lang_code = 1, 0, None
+    for char in sample:
+        codepoint = ord(char)
+        if not low <= codepoint <= high:
+            index = bisect_right(_SCRIPT_BLOCK_STARTS, codepoint) - 1
+            if index < 0 or codepoint > SCRIPT_BLOCKS[index][1]:
+                continue
+            low, high, lang_code = SCRIPT_BLOCKS[index]
+        counts[lang_code] = counts.get(lang_code, 0) + 1
+    
+    latin_count = counts.pop('en', 0)
+    if counts:
+        return max(counts, key=counts.get)
+    return 'en' if latin_count else None
+
 
 class LanguageDetector:
     """Multilingual language detection utility"""
     
     def __init__(self):
         self.language_patterns = LANGUAGE_PATTERNS
+        # One alternation with a named group per language; lastgroup names the match
+        self._combined_pattern = re.compile('|'.join(
+            f'(?P<{lang_code}>{pattern})' for lang_code, pattern in LANGUAGE_PATTERNS.items()
+        ))
         self.detection_methods = {
             'regex': True,
             'langdetect': LANGDETECT_AVAILABLE,
             'langid': LANGID_AVAILABLE
         }
+        # Per-instance cache; detection is deterministic (DetectorFactory.seed = 0)
+        self._detect_cached = lru_cache(maxsize=DETECTION_CACHE_SIZE)(self._detect_uncached)
     
     def detect_language(self, text: str) -> str:
         """
         Detect language of the text using multiple methods
         
+        Repeated text (running headers, boilerplate) is answered from a cache
+        keyed on the first DETECTION_PREFIX_LENGTH characters.
+        
         Args:
             text (str): Text to detect language for
             
@@ -47,6 +159,10 @@ class LanguageDetector:
         if not text or len(text.strip()) < 10:
             return 'en'  # Default to English for short text
         
+        return self._detect_cached(text[:DETECTION_PREFIX_LENGTH])
+    
+    def _detect_uncached(self, text: str) -> str:
+        """Run the detection methods in order on text"""
         # Method 1: Regex pattern matching
         detected_lang = self._detect_by_regex(text)
         if detected_lang:
@@ -67,11 +183,14 @@ class LanguageDetector:
         return 'en'  # Default to English
     
     def _detect_by_regex(self, text: str) -> Optional[str]:
-        """Detect language using regex patterns"""
-        for lang_code, pattern in self.language_patterns.items():
-            if re.search(pattern, text):
-                return lang_code
-        return None
+        """Detect language using Unicode script blocks, then regex patterns"""
+        detected = _detect_by_script(text)
+        if detected:
+            return detected
+        
+        # Only accented Latin letters left (Spanish, French, German, ...)
+        match = self._combined_pattern.search(text)
+        return match.lastgroup if match else None
     
     def _detect_by_langdetect(self, text: str) -> Optional[str]:
         """Detect language using langdetect library"""
@@ -86,6 +205,7 @@ class LanguageDetector:
     def _detect_by_langid(self, text: str) -> Optional[str]:
         """Detect language using langid library"""
         try:
+            import langid
             detected = langid.classify(text)[0]
             if detected in self.language_patterns:
                 return detected
@@ -96,50 +216,16 @@ class LanguageDetector:
     def get_supported_languages(self) -> dict:
         """Get information about supported languages and detection methods"""
         return {
-            'supported_languages': list(self.language_patterns.keys()),
+            'supported_languages': SUPPORTED_LANGUAGES,
             'detection_methods': self.detection_methods,
-            'indian_languages': [
-                'hi', 'bn', 'te', 'ta', 'gu', 'kn', 'ml', 'pa', 'ur', 'or', 'as', 'mr', 'sa'
-            ],
-            'international_languages': [
-                'en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'zh', 'ja', 'ko', 'ar', 'th'
-            ]
+            'indian_languages': INDIAN_LANGUAGES,
+            'international_languages': INTERNATIONAL_LANGUAGES
         }
     
     def is_indian_language(self, lang_code: str) -> bool:
         """Check if the language code represents an Indian language"""
-        indian_languages = [
-            'hi', 'bn', 'te', 'ta', 'gu', 'kn', 'ml', 'pa', 'ur', 'or', 'as', 'mr', 'sa'
-        ]
-        return lang_code in indian_languages
+        return lang_code in _INDIAN_LANGUAGE_SET
     
     def get_language_name(self, lang_code: str) -> str:
         """Get the full name of a language from its code"""
-        language_names = {
-            'hi': 'Hindi',
-            'bn': 'Bengali',
-            'te': 'Telugu',
-            'ta': 'Tamil',
-            'gu': 'Gujarati',
-            'kn': 'Kannada',
-            'ml': 'Malayalam',
-            'pa': 'Punjabi',
-            'ur': 'Urdu',
-            'or': 'Odia',
-            'as': 'Assamese',
-            'mr': 'Marathi',
-            'sa': 'Sanskrit',
-            'en': 'English',
-            'es': 'Spanish',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'pt': 'Portuguese',
-            'ru': 'Russian',
-            'zh': 'Chinese',
-            'ja': 'Japanese',
-            'ko': 'Korean',
-            'ar': 'Arabic',
-            'th': 'Thai'
-        }
-        return language_names.get(lang_code, 'Unknown') 
\ No newline at end of file
+        return LANGUAGE_NAMES.get(lang_code, 'Unknown')
@@ -6,12 +6,38 @@ Runs all test suites for the modular system
 
 import sys
 import os
+import io
 import unittest
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_test_module(module_name):
+    """
+    Run one test module in a worker process, capturing its verbose output
+    
+    Returns:
+        Tuple[str, Dict]: Output and the picklable outcome lists of the
+        module's TestResult, with tests replaced by their descriptions
+    """
+    if TESTS_DIR not in sys.path:
+        sys.path.insert(0, TESTS_DIR)
+    
+    suite = unittest.TestLoader().loadTestsFromName(module_name)
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    
+    outcome = {'testsRun': result.testsRun}
+    for name in ('failures', 'errors', 'skipped', 'expectedFailures'):
+        outcome[name] = [(str(test), detail) for test, detail in getattr(result, name)]
+    outcome['unexpectedSuccesses'] = [str(test) for test in result.unexpectedSuccesses]
+    return stream.getvalue(), outcome
+
 
 def run_all_tests():
     """Run all test suites"""
@@ -19,17 +45,25 @@ def run_all_tests():
     print("ENHANCED PDF OUTLINE EXTRACTOR - TEST SUITE")
     print("="*60)
     
-    # Discover and run all tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(__file__)
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Discover the test modules and run each in its own process (they share no state)
+    module_names = sorted(name[:-3] for name in os.listdir(TESTS_DIR)
+                          if name.startswith('test_') and name.endswith('.py'))
     start_time = time.time()
-    result = runner.run(suite)
+    with ProcessPoolExecutor(max_workers=max(1, min(os.cpu_count() or 1, len(module_names)))) as executor:
+        module_runs = list(executor.map(run_test_module, module_names))
     end_time = time.time()
     
+    # Print each module's output in discovery order and merge the results
+    result = unittest.TestResult()
+    for output, outcome in module_runs:
+        print(output, end='')
+        result.testsRun += outcome['testsRun']
+        result.failures.extend(outcome['failures'])
+        result.errors.extend(outcome['errors'])
+        result.skipped.extend(outcome['skipped'])
+        result.expectedFailures.extend(outcome['expectedFailures'])
+        result.unexpectedSuccesses.extend(outcome['unexpectedSuccesses'])
+    
     # Print summary
     print("\n" + "="*60)
     print("TEST SUMMARY")
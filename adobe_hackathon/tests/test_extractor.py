@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test PDF Extractor Module
+Tests the heading scoring of the multilingual outline extractor
+"""
+
+import sys
+import os
+import itertools
+import unittest
+
+import numpy as np
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.pdf_extractor.extractor import (
+    MultilingualPDFOutlineExtractor, TextElementArrays, _heading_candidate_mask, _make_base_scorer
+)
+
+
+def make_element(text, font_size=12.0, is_bold=False, page=1):
+    """Build a text element dict as produced by extract_text_elements"""
+    return {
+        'text': text,
+        'text_norm': text.lower(),
+        'font_size': font_size,
+        'font_name': 'Arial',
+        'is_bold': is_bold,
+        'page': page,
+        'bbox': (0, 0, 100, 12),
+        'language': None
+    }
+
+
+class TestExtractor(unittest.TestCase):
+    """Test cases for heading scoring"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.extractor = MultilingualPDFOutlineExtractor()
+        self.stats = {'thresholds': {'h3': 12.0}}
+    
+    def test_non_ascii_digit_headings(self):
+        """Test that numbered headings with non-ASCII digits get their pattern points"""
+        for text in ['１. Introduction', '๑. Introduction']:
+            score = self.extractor.calculate_heading_score_multilingual(make_element(text), self.stats)
+            self.assertEqual(score, 40.0, text)
+    
+    def test_candidate_mask_matches_base_scorer(self):
+        """Test that the vectorized candidate filter agrees with the per-element scorer"""
+        sizes = [8.0, 11.9, 12.0, 12.9, 13.0, 14.0, 15.9, 16.0, 18.0, 20.0, 24.0]
+        lengths = [0, 1, 2, 3, 50, 100, 101, 119, 120, 121, 200]
+        grid = list(itertools.product(sizes, [False, True], lengths))
+        elements = [make_element('x' * length, font_size=size, is_bold=bold)
+                    for size, bold, length in grid]
+        arrays = TextElementArrays.from_elements(elements)
+        max_length = self.extractor.max_heading_length
+        
+        threshold_sets = [
+            {},
+            {'h3': 13.0},
+            {'title': 20.0, 'h1': 16.0, 'h2': 14.0, 'h3': 13.0},
+            {'title': 24.0, 'h1': 18.0, 'h2': 16.0, 'h3': 12.0},
+        ]
+        for thresholds, min_score in itertools.product(threshold_sets, [-20, 0, 10, 15, 25, 40, 60]):
+            base_scorer = _make_base_scorer(thresholds, max_length)
+            expected = [base is not None and base[1] >= min_score
+                        for base in (base_scorer(size, bold, length) for size, bold, length in grid)]
+            mask = _heading_candidate_mask(arrays, thresholds, max_length, min_score)
+            np.testing.assert_array_equal(mask, expected, err_msg=f"{thresholds} {min_score}")
+    
+    def test_elements_without_font_name(self):
+        """Test that title and heading extraction do not require font_name"""
+        elements = [make_element('1. Introduction', font_size=18.0, is_bold=True),
+                    make_element('Body text of the document', font_size=12.0)]
+        for elem in elements:
+            del elem['font_name']
+        
+        stats = {'thresholds': {'title': 20.0, 'h1': 16.0, 'h2': 14.0, 'h3': 13.0}}
+        self.assertEqual(self.extractor.extract_title_multilingual(elements, stats), '1. Introduction')
+        headings = self.extractor.extract_headings_multilingual(elements, stats)
+        self.assertEqual([h['text'] for h in headings], ['1. Introduction'])
+
+
+if __name__ == '__main__':
+    unittest.main()
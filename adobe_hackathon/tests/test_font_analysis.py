@@ -8,10 +8,12 @@ import sys
 import os
 import unittest
 
+import numpy as np
+
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.utils.font_analyzer import FontAnalyzer
+from src.utils.font_analyzer import FontAnalyzer, HEADING_LEVEL_NAMES
 
 
 class TestFontAnalysis(unittest.TestCase):
@@ -133,6 +135,52 @@ class TestFontAnalysis(unittest.TestCase):
         self.assertIn('max_size', arial_stats)
         self.assertIn('size_range', arial_stats)
     
+    def test_distribution_soa(self):
+        """Test that the array API matches the element-list API"""
+        sizes = np.array([elem['font_size'] for elem in self.sample_elements])
+        names = np.array([elem['font_name'] for elem in self.sample_elements])
+        
+        stats = FontAnalyzer().analyze_distribution_soa(sizes, names)
+        self.assertEqual(stats, self.analyzer.analyze_font_distribution(self.sample_elements))
+        self.assertEqual(stats['font_distribution'], {'Arial': 5, 'Times': 2})
+        
+        # Input arrays are left untouched
+        self.assertEqual(sizes[0], 12.0)
+        self.assertEqual(sizes[-1], 24.0)
+    
+    def test_classify_headings_batch(self):
+        """Test that batch classification matches get_heading_level"""
+        sizes = np.array([8.0, 12.0, 14.0, 16.0, 18.0, 20.0, 24.0, 30.0])
+        self.assertTrue(np.all(self.analyzer.classify_headings_batch(sizes) == 0))
+        
+        self.analyzer.analyze_font_distribution(self.sample_elements)
+        codes = self.analyzer.classify_headings_batch(sizes)
+        
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual([HEADING_LEVEL_NAMES[code] for code in codes],
+                         [self.analyzer.get_heading_level(size) for size in sizes])
+    
+    def test_repeated_analysis(self):
+        """Test that identical input reuses the stored statistics"""
+        stats = self.analyzer.analyze_font_distribution(self.sample_elements)
+        self.assertIs(self.analyzer.analyze_font_distribution(list(self.sample_elements)), stats)
+        
+        changed_elements = self.sample_elements + [{'font_size': 12.0, 'font_name': 'Times'}]
+        changed_stats = self.analyzer.analyze_font_distribution(changed_elements)
+        self.assertIsNot(changed_stats, stats)
+        self.assertEqual(changed_stats['font_distribution'], {'Arial': 5, 'Times': 3})
+    
+    def test_set_font_statistics(self):
+        """Test that installed statistics drive heading levels like an analysis"""
+        stats = self.analyzer.analyze_font_distribution(self.sample_elements)
+        
+        other = FontAnalyzer()
+        other.set_font_statistics(stats)
+        self.assertIs(other.get_font_statistics(), stats)
+        for size in (12.0, 16.0, 20.0, 24.0):
+            self.assertEqual(other.get_heading_level(size), self.analyzer.get_heading_level(size))
+            self.assertEqual(other.is_likely_heading(size), self.analyzer.is_likely_heading(size))
+    
     def test_empty_elements(self):
         """Test handling of empty elements"""
         empty_stats = self.analyzer.analyze_font_distribution([])
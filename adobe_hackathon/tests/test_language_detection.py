@@ -11,7 +11,7 @@ import unittest
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.utils.language_detector import LanguageDetector
+from src.utils.language_detector import LanguageDetector, LANGDETECT_AVAILABLE
 
 
 class TestLanguageDetection(unittest.TestCase):
@@ -91,6 +91,18 @@ class TestLanguageDetection(unittest.TestCase):
         methods = self.detector.detection_methods
         self.assertTrue(methods['regex'])  # Regex should always be available
         # langdetect and langid may or may not be available depending on installation
+    
+    def test_unsupported_script_fallback(self):
+        """Test that text in an unsupported script falls back to English"""
+        text = "Αυτή είναι μια ελληνική πρόταση για δοκιμή."
+        detected = self.detector.detect_language(text)
+        self.assertEqual(detected, 'en')
+    
+    @unittest.skipUnless(LANGDETECT_AVAILABLE, "langdetect not installed")
+    def test_langdetect_unsupported_language(self):
+        """Test that langdetect results outside the supported languages are discarded"""
+        text = "Tämä on suomenkielinen lause testausta varten."
+        self.assertIsNone(self.detector._detect_by_langdetect(text))
 
 
 if __name__ == '__main__':